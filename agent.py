@@ -5,40 +5,254 @@ FIXED: Using trace() + start_as_current_observation() pattern
 """
 
 import os
+import sys
 import time
-from typing import Dict, Any, Optional
+import asyncio
+import atexit
+import logging
+import logging.handlers
+import queue
+import json
+import re
+import random
+import hashlib
+import threading
+import concurrent.futures
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Any, Optional, Callable, List, Awaitable
+import requests
+from requests.adapters import HTTPAdapter
+from cachetools import TTLCache
 from dotenv import load_dotenv
-from crewai import Agent, Task, Crew, Process, LLM
+from crewai import Agent, Task, Crew, Process
+from crewai.crews.crew_output import CrewOutput
 from crewai_tools import SerperDevTool
-from langfuse import Langfuse
+from lf_client import lf as langfuse, lf_error, langfuse_enabled, shutdown_langfuse
+from llm_config import llm
 
 load_dotenv()
 
-# Initialize Langfuse
-langfuse_enabled = os.getenv("LANGFUSE_ENABLED", "true").lower() == "true"
-langfuse = None
+logger = logging.getLogger("agent")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_listener: Optional[logging.handlers.QueueListener] = None
 
-if langfuse_enabled:
-    try:
-        langfuse = Langfuse(
-            secret_key=os.getenv("LANGFUSE_SECRET_KEY"),
-            public_key=os.getenv("LANGFUSE_PUBLIC_KEY"),
-            host=os.getenv("LANGFUSE_HOST", "https://cloud.langfuse.com")
-        )
-        print("✓ Langfuse enabled")
-    except Exception as e:
-        print(f"⚠️  Langfuse disabled: {e}")
-        langfuse_enabled = False
 
-# Use smaller, faster model to avoid rate limits
-llm = LLM(
-    model="groq/llama-3.1-8b-instant",
-    api_key=os.getenv("GROQ_API_KEY"),
-    temperature=0.5
-)
+def _stop_log_listener():
+    global _log_listener
+    if _log_listener:
+        # stop() writes out anything still queued
+        _log_listener.stop()
+        _log_listener = None
+
+
+def configure_logging(queued: bool = True):
+    """Send agent logs to stdout, through a queue or directly
+
+    Queued, callers (incl. run_batch workers) never block on stdout, but
+    records may show up after later print() output. The interactive CLI
+    mixes logs with print(), so it logs directly to keep them in order.
+    """
+    global _log_listener
+    _stop_log_listener()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    
+    handler = logging.StreamHandler(sys.stdout)
+    if not queued:
+        logger.addHandler(handler)
+        return
+    
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    _log_listener = logging.handlers.QueueListener(log_queue, handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _log_listener.start()
+
+
+configure_logging()
+# atexit runs hooks in reverse order, so this runs before lf_client's exit
+# flush; that flush logs on its own logger and does not need this one
+atexit.register(_stop_log_listener)
+
+# Pooled HTTP sessions so repeated Serper calls reuse TLS connections.
+# requests.Session is not documented as thread-safe and run_batch calls
+# the search tool from several threads, so each thread gets its own.
+_sessions = threading.local()
+_all_sessions: List[requests.Session] = []
+_sessions_lock = threading.Lock()
+
+
+def _thread_session() -> requests.Session:
+    session = getattr(_sessions, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(max_retries=3))
+        _sessions.session = session
+        with _sessions_lock:
+            _all_sessions.append(session)
+    return session
+
+
+def _close_sessions():
+    with _sessions_lock:
+        for session in _all_sessions:
+            session.close()
+
+
+atexit.register(_close_sessions)
+
+if langfuse:
+    logger.info("✓ Langfuse enabled")
+elif lf_error:
+    logger.warning(f"⚠️  Langfuse disabled: {lf_error}")
+
+
+def _debug_flush():
+    # FORCE_FLUSH=1 sends each span right away, for debugging
+    if langfuse and os.getenv("FORCE_FLUSH") == "1":
+        langfuse.flush()
+
+
+class _NoopSpan:
+    """Stand-in for a span that was not sampled"""
+    
+    def update(self, **_):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+# Fraction of successful spans sent to Langfuse; errors are always sent
+LANGFUSE_SAMPLE_RATE = float(os.getenv("LANGFUSE_SAMPLE_RATE", "0.1"))
+
 
-# Tools
-search_tool = SerperDevTool()
+def _timestamp(t: Optional[float] = None) -> str:
+    """Format a span timestamp; only called when a span is emitted"""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(t))
+
+
+@contextmanager
+def sampled_span(name: str, input: Dict[str, Any], sample_rate: Optional[float] = None):
+    """Head-sampled Langfuse span; yields _NOOP_SPAN when not sampled"""
+    rate = LANGFUSE_SAMPLE_RATE if sample_rate is None else sample_rate
+    if random.random() >= rate:
+        yield _NOOP_SPAN
+        return
+    
+    with langfuse.start_as_current_observation(
+        as_type="span",
+        name=name,
+        input={**input, "timestamp": _timestamp()}
+    ) as span:
+        yield span
+
+
+# Span payload budget; keeps ingestion rows small at high volume. The
+# "…[+N chars]" suffix and the "length" field show when text was cut.
+SPAN_TEXT_BUDGET = 256
+
+
+def _compact(s: str, budget: int = SPAN_TEXT_BUDGET) -> str:
+    return s if len(s) <= budget else s[:budget] + f"…[+{len(s) - budget} chars]"
+
+
+class _RedisCache:
+    """Minimal TTL cache on Redis, shared across processes"""
+    
+    def __init__(self, url: str, prefix: str, ttl: int):
+        import redis
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self.prefix = prefix
+        self.ttl = ttl
+    
+    # A cache outage is treated as a miss, never as a failed request
+    
+    def get(self, key: str) -> Any:
+        try:
+            raw = self.client.get(self.prefix + key)
+            return None if raw is None else json.loads(raw)
+        except Exception as e:
+            logger.warning(f"⚠️  Cache read failed: {e}")
+            return None
+    
+    def set(self, key: str, value: Any):
+        try:
+            self.client.setex(self.prefix + key, self.ttl, json.dumps(value))
+        except Exception as e:
+            logger.warning(f"⚠️  Cache write failed: {e}")
+
+
+class _LocalCache:
+    """Thread-safe in-process LRU + TTL cache"""
+    
+    def __init__(self, maxsize: int, ttl: int):
+        self.cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.lock = threading.Lock()
+    
+    def get(self, key: str) -> Any:
+        with self.lock:
+            return self.cache.get(key)
+    
+    def set(self, key: str, value: Any):
+        with self.lock:
+            self.cache[key] = value
+
+
+def _make_cache(prefix: str, maxsize: int, ttl: int):
+    # CACHE_BACKEND=redis shares the cache between workers
+    if os.getenv("CACHE_BACKEND", "memory").lower() == "redis":
+        url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        return _RedisCache(url, prefix, ttl)
+    return _LocalCache(maxsize, ttl)
+
+
+def _cache_key(text: str) -> str:
+    return hashlib.sha1(text.lower().strip().encode()).hexdigest()
+
+
+_search_cache = _make_cache("search:", maxsize=1024, ttl=3600)
+_answer_cache = _make_cache("answer:", maxsize=1024, ttl=600)
+
+
+class CachedSerperDevTool(SerperDevTool):
+    """SerperDevTool that reuses results for repeated queries"""
+    
+    def _run(self, **kwargs: Any) -> Any:
+        query = kwargs.get("search_query") or kwargs.get("query") or ""
+        key = _cache_key(query)
+        
+        cached = _search_cache.get(key)
+        if cached is not None:
+            logger.info(f"♻️  Search cache hit (saved a Serper call): {query[:40]}")
+            return cached
+        
+        result = super()._run(**kwargs)
+        _search_cache.set(key, result)
+        return result
+
+
+class _PooledRequests:
+    """requests module stand-in whose post() goes through a per-thread session"""
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(requests, name)
+    
+    def post(self, *args: Any, **kwargs: Any) -> requests.Response:
+        return _thread_session().post(*args, **kwargs)
+
+
+# SerperDevTool calls requests.post() directly and takes no session,
+# so point its module-level requests reference at the pooled sessions
+_serper_module = sys.modules.get(SerperDevTool.__module__)
+if _serper_module is not None and hasattr(_serper_module, "requests"):
+    _serper_module.requests = _PooledRequests()
+
+# Tools, registered by name so agents look them up in one place
+search_tool = CachedSerperDevTool()
+
+TOOLS: Dict[str, Any] = {
+    "search": search_tool,
+}
 
 
 def create_researcher():
@@ -46,7 +260,7 @@ def create_researcher():
         role='Researcher',
         goal='Find information',
         backstory='Research expert.',
-        tools=[search_tool],
+        tools=[TOOLS["search"]],
         llm=llm,
         verbose=False,
         allow_delegation=False,
@@ -67,41 +281,311 @@ def create_writer():
     )
 
 
-def research_and_write(topic: str, content_type: str = "article"):
-    """Research and write with proper Langfuse tracking"""
+class TokenBucket:
+    """Thread-safe token bucket: blocks only when the bucket is empty"""
     
-    print(f"\n{'='*60}")
-    print(f"🚀 Topic: {topic}")
-    print(f"{'='*60}\n")
+    def __init__(self, calls: int, period: float = 60.0):
+        if calls < 1:
+            raise ValueError(f"TokenBucket needs at least 1 call per period, got {calls}")
+        self.capacity = calls
+        self.tokens = float(calls)
+        self.fill_rate = calls / period
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated) * self.fill_rate
+                )
+                self.updated = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                wait = (1 - self.tokens) / self.fill_rate
+            time.sleep(wait)
+
+
+# One limiter shared by every thread, so batches respect the same budget.
+# It counts crew runs, not Groq requests: one run makes several LLM
+# calls (up to max_iter per agent, plus tool turns), so keep CREW_RPM
+# well below the Groq per-minute limit.
+CREW_RPM = int(os.getenv("CREW_RPM", "30"))
+crew_limiter = TokenBucket(CREW_RPM)
+
+
+def _kickoff(crew):
+    crew_limiter.acquire()
+    return crew.kickoff()
+
+
+# Agent factories by name
+AGENTS: Dict[str, Callable[[], Agent]] = {
+    "researcher": create_researcher,
+    "writer": create_writer,
+}
+
+# Agents are built once per thread and reused. A crew attaches itself to
+# its agents while running, so threads (run_batch workers) get their own.
+_agents = threading.local()
+
+
+def get_agent(name: str) -> Agent:
+    cache = _agents.__dict__
+    if name not in cache:
+        cache[name] = AGENTS[name]()
+    return cache[name]
+
+
+async def _run_task(agent, description: str, expected_output: str) -> CrewOutput:
+    """Run a single task as its own crew without blocking the event loop"""
+    task = Task(
+        description=description,
+        expected_output=expected_output,
+        agent=agent
+    )
+    
+    crew = Crew(
+        agents=[agent],
+        tasks=[task],
+        process=Process.sequential,
+        verbose=False,
+        memory=False,
+        cache=False
+    )
+    
+    return await asyncio.to_thread(_kickoff, crew)
+
+
+async def _execute_graph(
+    nodes: Dict[str, Callable[[Dict[str, Any]], Awaitable[Any]]],
+    deps: Dict[str, List[str]]
+) -> Dict[str, Any]:
+    """Run nodes in dependency order, independent nodes concurrently
+
+    Each wave starts every node whose dependencies are done. A node gets
+    the outputs computed so far and returns its own output.
+    """
+    outputs: Dict[str, Any] = {}
+    pending = set(nodes)
+    
+    while pending:
+        ready = [n for n in pending if all(d in outputs for d in deps.get(n, []))]
+        if not ready:
+            raise ValueError(f"Unresolvable dependencies: {sorted(pending)}")
+        
+        results = await asyncio.gather(*[nodes[n](outputs) for n in ready])
+        outputs.update(zip(ready, results))
+        pending.difference_update(ready)
+    
+    return outputs
+
+
+async def research_and_write_async(
+    topic: str,
+    content_type: str = "article",
+    fact_check: bool = False
+) -> CrewOutput:
+    """Research and write with proper Langfuse tracking
+
+    Returns the write step's CrewOutput. With fact_check=True an extra
+    crew run checks the research; it only needs the research, so it runs
+    at the same time as the writing, and its TaskOutput is appended to
+    the result's tasks_output.
+    """
+    
+    logger.info(f"\n{'='*60}")
+    logger.info(f"🚀 Topic: {topic}")
+    logger.info(f"{'='*60}\n")
     
     start_time = time.time()
     
     # Prepare input data
     input_data = {
         "topic": topic,
-        "content_type": content_type,
-        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+        "content_type": content_type
     }
     
-    # Create agents
-    researcher = create_researcher()
-    writer = create_writer()
+    # Reuse agents
+    researcher = get_agent("researcher")
+    writer = get_agent("writer")
     
     # SHORT task descriptions to save tokens
+    nodes = {
+        "research": lambda out: _run_task(
+            researcher,
+            f"Research: {topic}. Find 3-5 key facts.",
+            "Key facts list"
+        ),
+        "write": lambda out: _run_task(
+            writer,
+            f"Write brief {content_type} on {topic} using these facts:\n{out['research']}",
+            f"Short {content_type}"
+        ),
+    }
+    deps = {
+        "research": [],
+        "write": ["research"],
+    }
+    
+    if fact_check:
+        nodes["fact_check"] = lambda out: _run_task(
+            researcher,
+            f"Fact-check these facts about {topic}. Flag any that are wrong:\n{out['research']}",
+            "Short list of issues, or 'No issues'"
+        )
+        deps["fact_check"] = ["research"]
+    
+    try:
+        logger.info("⏳ Executing (this may take a moment)...")
+        
+        # Execute with Langfuse tracking (no-op span when disabled)
+        span_ctx = sampled_span("research_and_write", input_data) if langfuse else nullcontext(_NOOP_SPAN)
+        with span_ctx as span:
+            # Execute graph
+            outputs = await _execute_graph(nodes, deps)
+            result = outputs["write"]
+            result_str = str(result)
+            if fact_check:
+                result.tasks_output.extend(outputs["fact_check"].tasks_output)
+                result_str += f"\n\nFact check:\n{outputs['fact_check']}"
+            
+            # Calculate duration
+            duration = time.time() - start_time
+            
+            # Update span with output
+            if span is not _NOOP_SPAN:
+                span.update(
+                    output={
+                        "content": _compact(result_str),
+                        "length": len(result_str),
+                        "status": "success"
+                    },
+                    metadata={
+                        "topic": topic,
+                        "content_type": content_type,
+                        "execution_time_seconds": duration
+                    }
+                )
+        
+        if span is not _NOOP_SPAN:
+            _debug_flush()
+            logger.info("✓ Logged to Langfuse")
+            logger.info(f"📊 Dashboard: https://cloud.langfuse.com")
+        
+        return result
+        
+    except Exception as e:
+        logger.error(f"\n❌ Error: {e}")
+        
+        # Log error
+        if langfuse:
+            try:
+                duration = time.time() - start_time
+                with langfuse.start_as_current_observation(
+                    as_type="span",
+                    name=f"error_{topic[:20]}",
+                    input={**input_data, "timestamp": _timestamp(start_time)}
+                ) as span:
+                    span.update(
+                        output={"error": str(e), "status": "failed"},
+                        metadata={
+                            "topic": topic,
+                            "execution_time_seconds": duration
+                        }
+                    )
+                _debug_flush()
+            except:
+                pass
+        raise
+
+
+def research_and_write(
+    topic: str,
+    content_type: str = "article",
+    fact_check: bool = False
+) -> CrewOutput:
+    """Blocking wrapper around research_and_write_async
+
+    Safe to call from code that already runs an event loop (Jupyter,
+    async apps): the coroutine then runs on a worker thread.
+    """
+    coro = research_and_write_async(topic, content_type, fact_check)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+# "[1] ..." item markers in batched responses, also when wrapped in
+# Markdown like "**[1]**" or "### [1]"
+_BATCH_ITEM_RE = re.compile(r"^[ \t]*[*#_]*[ \t]*\[(\d+)\][*_]*[ \t]*", re.MULTILINE)
+
+
+def _split_numbered(text: str, count: int) -> Dict[int, str]:
+    """Map item number -> body for a "[1] ... [2] ..." response"""
+    parts = _BATCH_ITEM_RE.split(text)
+    items = {}
+    # parts = [preamble, n1, body1, n2, body2, ...]
+    for num, body in zip(parts[1::2], parts[2::2]):
+        n = int(num)
+        if 1 <= n <= count and body.strip():
+            items[n] = body.strip()
+    return items
+
+
+def research_and_write_batched(topics: List[str], content_type: str = "article") -> List[Any]:
+    """Research and write several topics with one crew run
+
+    All topics share one prompt, so the system prompt and HTTP overhead
+    are paid once instead of per topic. Topics missing from the response
+    are retried concurrently through run_batch; a retry that fails gets
+    its exception in place of a result.
+    """
+    if not topics:
+        return []
+    
+    logger.info(f"\n{'='*60}")
+    logger.info(f"🚀 Batch of {len(topics)} topics")
+    logger.info(f"{'='*60}\n")
+    
+    start_time = time.time()
+    
+    input_data = {
+        "topics": topics,
+        "content_type": content_type
+    }
+    
+    researcher = get_agent("researcher")
+    writer = get_agent("writer")
+    
+    listing = "\n".join(f"[{i}] {topic}" for i, topic in enumerate(topics, 1))
+    response_format = "\n".join(f"[{i}] <{content_type}>" for i in range(1, len(topics) + 1))
+    
     research_task = Task(
-        description=f"Research: {topic}. Find 3-5 key facts.",
-        expected_output="Key facts list",
+        description=f"Research each topic. Find 3-5 key facts per topic.\n{listing}",
+        expected_output="Key facts per topic, numbered like the topics",
         agent=researcher
     )
     
     write_task = Task(
-        description=f"Write brief {content_type} on {topic}.",
-        expected_output=f"Short {content_type}",
+        description=(
+            f"Write a brief {content_type} for each topic:\n{listing}\n"
+            "Start each one with its number in brackets on a new line."
+        ),
+        expected_output=f"Exactly this layout:\n{response_format}",
         agent=writer,
         context=[research_task]
     )
     
-    # Create crew
     crew = Crew(
         agents=[researcher, writer],
         tasks=[research_task, write_task],
@@ -112,89 +596,142 @@ def research_and_write(topic: str, content_type: str = "article"):
     )
     
     try:
-        print("⏳ Executing (this may take a moment)...")
-        
-        # Add delay to avoid rate limits
-        time.sleep(2)
+        logger.info("⏳ Executing (this may take a moment)...")
         
-        # Execute with Langfuse tracking
-        if langfuse:
-            with langfuse.start_as_current_observation(
-                as_type="span",
-                name=f"research_and_write",
-                input=input_data
-            ) as span:
-                # Execute crew
-                result = crew.kickoff()
-                result_str = str(result)
-                
-                # Calculate duration
-                duration = time.time() - start_time
-                
-                # Update span with output
+        span_ctx = sampled_span("research_and_write_batched", input_data) if langfuse else nullcontext(_NOOP_SPAN)
+        with span_ctx as span:
+            result_str = str(_kickoff(crew))
+            items = _split_numbered(result_str, len(topics))
+            
+            duration = time.time() - start_time
+            
+            if span is not _NOOP_SPAN:
                 span.update(
                     output={
-                        "content": result_str[:800],
+                        "content": _compact(result_str),
                         "length": len(result_str),
+                        "parsed": len(items),
                         "status": "success"
                     },
                     metadata={
-                        "topic": topic,
+                        "topics": len(topics),
                         "content_type": content_type,
                         "execution_time_seconds": duration
                     }
                 )
-            
-            langfuse.flush()
-            print("✓ Logged to Langfuse")
-            print(f"📊 Dashboard: https://cloud.langfuse.com")
-        else:
-            # Execute without tracking
-            result = crew.kickoff()
-            result_str = str(result)
         
-        return result
+        if span is not _NOOP_SPAN:
+            _debug_flush()
+            logger.info("✓ Logged to Langfuse")
+            logger.info(f"📊 Dashboard: https://cloud.langfuse.com")
         
     except Exception as e:
-        print(f"\n❌ Error: {e}")
+        logger.error(f"\n❌ Error: {e}")
         
-        # Log error
         if langfuse:
             try:
                 duration = time.time() - start_time
                 with langfuse.start_as_current_observation(
                     as_type="span",
-                    name=f"error_{topic[:20]}",
-                    input=input_data
+                    name="error_batch",
+                    input={**input_data, "timestamp": _timestamp(start_time)}
                 ) as span:
                     span.update(
                         output={"error": str(e), "status": "failed"},
                         metadata={
-                            "topic": topic,
+                            "topics": len(topics),
                             "execution_time_seconds": duration
                         }
                     )
-                langfuse.flush()
+                _debug_flush()
             except:
                 pass
         raise
+    
+    missing = [i for i in range(1, len(topics) + 1) if i not in items]
+    if missing:
+        logger.warning(f"⚠️  {len(missing)} topic(s) missing from batched response, retrying")
+        # Retried concurrently; a failed retry comes back as its exception
+        # and only loses its own topic
+        retried = run_batch([topics[i - 1] for i in missing], content_type)
+        for i, result in zip(missing, retried):
+            # Same shape as batched items
+            items[i] = result if isinstance(result, Exception) else str(result)
+    
+    return [items[i] for i in range(1, len(topics) + 1)]
+
+
+def run_batch(
+    topics: List[str],
+    content_type: str = "article",
+    max_concurrency: int = 4,
+    on_progress: Optional[Callable[[int, int, str], None]] = None,
+    single_call: bool = False
+) -> List[Any]:
+    """Run research_and_write for several topics concurrently
+
+    Results come back in the same order as topics. A failed topic gets
+    its exception in place of a result so one error doesn't sink the batch.
+    on_progress(done, total, topic) is called as each topic finishes.
+    With single_call=True all topics go through research_and_write_batched.
+    """
+    if not topics:
+        return []
+    
+    if single_call:
+        try:
+            results = research_and_write_batched(topics, content_type)
+        except Exception as e:
+            results = [e] * len(topics)
+        
+        if on_progress:
+            for i, topic in enumerate(topics, 1):
+                on_progress(i, len(topics), topic)
+        return results
+    
+    results: List[Any] = [None] * len(topics)
+    done = 0
+    
+    # max_concurrency bounds in-flight Groq requests
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+        futures = {
+            pool.submit(research_and_write, topic, content_type): i
+            for i, topic in enumerate(topics)
+        }
+        for future in concurrent.futures.as_completed(futures):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                results[i] = e
+            
+            done += 1
+            if on_progress:
+                on_progress(done, len(topics), topics[i])
+    
+    return results
 
 
 def quick_research(question: str):
     """Quick research with Langfuse tracking"""
     
-    print(f"\n{'='*60}")
-    print(f"❓ {question}")
-    print(f"{'='*60}\n")
+    logger.info(f"\n{'='*60}")
+    logger.info(f"❓ {question}")
+    logger.info(f"{'='*60}\n")
+    
+    answer_key = _cache_key(question)
+    cached = _answer_cache.get(answer_key)
+    if cached is not None:
+        logger.info("♻️  Answer cache hit (saved LLM + search calls)")
+        return cached
     
     start_time = time.time()
     
     input_data = {
-        "question": question,
-        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+        "question": question
     }
     
-    researcher = create_researcher()
+    researcher = get_agent("researcher")
     
     task = Task(
         description=f"Answer: {question}. Be brief.",
@@ -212,24 +749,20 @@ def quick_research(question: str):
     )
     
     try:
-        print("⏳ Researching...")
-        time.sleep(1)
+        logger.info("⏳ Researching...")
         
-        # Execute with Langfuse tracking
-        if langfuse:
-            with langfuse.start_as_current_observation(
-                as_type="span",
-                name="quick_research",
-                input=input_data
-            ) as span:
-                result = crew.kickoff()
-                result_str = str(result)
-                
-                duration = time.time() - start_time
-                
+        # Execute with Langfuse tracking (no-op span when disabled)
+        span_ctx = sampled_span("quick_research", input_data) if langfuse else nullcontext(_NOOP_SPAN)
+        with span_ctx as span:
+            result = _kickoff(crew)
+            result_str = str(result)
+            
+            duration = time.time() - start_time
+            
+            if span is not _NOOP_SPAN:
                 span.update(
                     output={
-                        "answer": result_str[:800],
+                        "answer": _compact(result_str),
                         "length": len(result_str)
                     },
                     metadata={
@@ -237,18 +770,17 @@ def quick_research(question: str):
                         "execution_time_seconds": duration
                     }
                 )
-            
-            langfuse.flush()
-            print("✓ Logged to Langfuse")
-            print(f"📊 Dashboard: https://cloud.langfuse.com")
-        else:
-            result = crew.kickoff()
-            result_str = str(result)
         
-        return result
+        if span is not _NOOP_SPAN:
+            _debug_flush()
+            logger.info("✓ Logged to Langfuse")
+            logger.info(f"📊 Dashboard: https://cloud.langfuse.com")
+        
+        _answer_cache.set(answer_key, result_str)
+        return result_str
         
     except Exception as e:
-        print(f"\n❌ Error: {e}")
+        logger.error(f"\n❌ Error: {e}")
         
         if langfuse:
             try:
@@ -256,13 +788,13 @@ def quick_research(question: str):
                 with langfuse.start_as_current_observation(
                     as_type="span",
                     name="error_research",
-                    input=input_data
+                    input={**input_data, "timestamp": _timestamp(start_time)}
                 ) as span:
                     span.update(
                         output={"error": str(e)},
                         metadata={"execution_time_seconds": duration}
                     )
-                langfuse.flush()
+                _debug_flush()
             except:
                 pass
         raise
@@ -279,15 +811,16 @@ def test_langfuse():
         
         start_time = time.time()
         
+        # Simulate some work (skipped with TEST_FAST=1)
+        if os.getenv("TEST_FAST") != "1":
+            time.sleep(0.5)
+        
         # Use start_as_current_observation with span
         with langfuse.start_as_current_observation(
             as_type="span",
             name="connection_test",
             input={"test": "Connection check", "time": time.strftime("%H:%M:%S")}
         ) as span:
-            # Simulate some work
-            time.sleep(0.5)
-            
             duration = time.time() - start_time
             
             span.update(
@@ -298,9 +831,6 @@ def test_langfuse():
                 }
             )
         
-        # Flush to send immediately
-        langfuse.flush()
-        
         print("✅ Langfuse connection successful!")
         print(f"📊 Check dashboard: https://cloud.langfuse.com")
         print("    Look for span named 'connection_test'")
@@ -312,6 +842,9 @@ def test_langfuse():
 
 
 def main():
+    # Keep progress logs in order with the menu and results below
+    configure_logging(queued=False)
+    
     print("""
     ╔════════════════════════════════════════════════╗
     ║      Multi-Agent System with Langfuse         ║
@@ -320,7 +853,7 @@ def main():
     """)
     
     print(f"Langfuse: {'✅' if langfuse_enabled else '❌'}")
-    print("⚠️  Note: Waits added to avoid Groq rate limits\n")
+    print(f"⚠️  Note: crew runs limited to {CREW_RPM}/min\n")
     
     while True:
         print("\n" + "="*50)
@@ -329,15 +862,15 @@ def main():
         print("1. Research & Write (takes ~30s)")
         print("2. Quick Research (takes ~15s)")
         print("3. Test Langfuse")
+        print("4. Batch Research & Write")
         print("0. Exit")
         print("="*50)
         
-        choice = input("\nChoice (0-3): ").strip()
+        choice = input("\nChoice (0-4): ").strip()
         
         if choice == "0":
             print("\n👋 Goodbye!")
-            if langfuse:
-                langfuse.flush()
+            shutdown_langfuse()
             break
             
         elif choice == "1":
@@ -374,6 +907,31 @@ def main():
                 
         elif choice == "3":
             test_langfuse()
+            
+        elif choice == "4":
+            raw = input("\nTopics (comma-separated): ").strip()
+            topics = [t.strip() for t in raw.split(",") if t.strip()]
+            if not topics:
+                print("⚠️  Topics required")
+                continue
+            
+            content_type = input("Type [article]: ").strip() or "article"
+            single_call = input("Single LLM call? [y/N]: ").strip().lower() == "y"
+            
+            results = run_batch(
+                topics,
+                content_type,
+                on_progress=lambda done, total, topic: print(f"📦 {done}/{total} done: {topic}"),
+                single_call=single_call
+            )
+            for topic, result in zip(topics, results):
+                print("\n" + "="*50)
+                if isinstance(result, Exception):
+                    print(f"❌ {topic}: {result}")
+                    continue
+                print(f"✅ {topic}:")
+                print("="*50)
+                print(result)
         else:
             print("⚠️  Invalid")
 
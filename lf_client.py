@@ -0,0 +1,86 @@
+"""
+Shared Langfuse client for the agents
+"""
+
+import os
+import atexit
+import logging
+from functools import lru_cache
+from typing import Any, Optional
+from dotenv import load_dotenv
+from langfuse import Langfuse
+
+load_dotenv()
+
+# Not routed through agent.py's queued logger, which may already be
+# stopped when the exit hook runs
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def get_langfuse() -> Langfuse:
+    """Shared Langfuse client, configured from the environment"""
+    return Langfuse(
+        secret_key=os.environ["LANGFUSE_SECRET_KEY"],
+        public_key=os.environ["LANGFUSE_PUBLIC_KEY"],
+        host=os.getenv("LANGFUSE_HOST", "https://cloud.langfuse.com"),
+        # Batch spans into fewer HTTP requests
+        flush_at=int(os.getenv("LANGFUSE_FLUSH_AT", "20")),
+        flush_interval=float(os.getenv("LANGFUSE_FLUSH_INTERVAL", "5.0"))
+    )
+
+
+# Initialize Langfuse; lf is None when disabled or misconfigured
+langfuse_enabled = os.getenv("LANGFUSE_ENABLED", "true").lower() == "true"
+lf: Optional[Langfuse] = None
+lf_error: Optional[Exception] = None
+
+if langfuse_enabled:
+    try:
+        lf = get_langfuse()
+    except Exception as e:
+        lf_error = e
+        langfuse_enabled = False
+
+# Serialize span input/output/metadata with orjson when it is installed.
+# Langfuse routes these through langfuse._client.attributes._serialize;
+# anything orjson can't handle falls back to the SDK's own encoder.
+try:
+    import orjson
+    from langfuse._client import attributes as _lf_attributes
+except ImportError:
+    orjson = None
+    _lf_attributes = None
+
+if orjson is not None and hasattr(_lf_attributes, "_serialize"):
+    _lf_serialize = _lf_attributes._serialize
+    
+    def _orjson_serialize(obj: Any) -> Optional[str]:
+        # Same passthrough as the SDK: strings are sent as-is, not JSON-quoted
+        if obj is None or isinstance(obj, str):
+            return obj
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            return _lf_serialize(obj)
+    
+    _lf_attributes._serialize = _orjson_serialize
+
+# Spans are batched by the client; pending ones are flushed once at exit
+_flush_stopped = False
+
+
+def shutdown_langfuse():
+    """Send pending spans; safe to call more than once"""
+    global _flush_stopped
+    if _flush_stopped or not lf:
+        return
+    _flush_stopped = True
+    try:
+        lf.flush()
+    except Exception as e:
+        # Runs at exit too, so never let a failed flush crash the process
+        logger.warning(f"⚠️  Langfuse flush failed: {e}")
+
+
+atexit.register(shutdown_langfuse)
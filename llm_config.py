@@ -0,0 +1,27 @@
+"""
+Shared LLM configuration for the agents
+"""
+
+import os
+from dotenv import load_dotenv
+from crewai import LLM
+
+load_dotenv()
+
+# Use smaller, faster model to avoid rate limits
+LLM_MODEL = os.getenv("LLM_MODEL", "groq/llama-3.1-8b-instant")
+
+# Prompt caching: agent role/goal/backstory go in the system message and
+# never change, while the topic goes in the user message, so every call
+# starts with the same prefix. Groq caches matching prefixes on its own;
+# no request option is needed.
+
+# GROQ_API_KEY only applies to Groq models; for other providers pass None
+# so crewAI falls back to that provider's own env var (e.g. ANTHROPIC_API_KEY)
+_api_key = os.getenv("GROQ_API_KEY") if LLM_MODEL.startswith("groq/") else None
+
+llm = LLM(
+    model=LLM_MODEL,
+    api_key=_api_key,
+    temperature=0.5
+)